@@ -2,27 +2,59 @@
 AI-Powered Mock Interview Platform
 Streamlit application for conducting and evaluating mock interviews.
 """
+import html
 import streamlit as st
 import time
+from pathlib import Path
+from string import Template
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from config import (
     OPENAI_API_KEY,
     MIN_QUESTIONS,
     MAX_QUESTIONS,
     QUESTION_TIME_LIMIT_SECONDS,
+    INITIAL_QUESTION_DIFFICULTIES,
+    PREFETCH_MAX_WORKERS,
 )
 from resume_analyzer import analyze_resume, extract_text_from_pdf
 from jd_parser import parse_job_description
 from interviewer import (
+    QUESTION_CATEGORIES,
     Question,
     generate_question,
+    generate_question_batch,
     evaluate_answer,
     get_next_difficulty,
     should_terminate_early,
+    ScoreTracker,
     AnswerEvaluation,
 )
 from report_generator import generate_report
 
+CSS_PATH = Path(__file__).parent / "static" / "styles.css"
+# HTML snippets for LLM-generated content; values are escaped before substitution
+QUESTION_TEMPLATE = Template(
+    '<div class="question-box">'
+    '<strong>Question $n</strong> (Difficulty: $difficulty | Category: $category)<br><br>'
+    '$text'
+    '</div>'
+)
+LAST_SCORE_TEMPLATE = Template(
+    '<div class="card">Last answer score: '
+    '<span class="score-badge $score_class">$score/100</span>'
+    '<br><small>Feedback: $feedback</small></div>'
+)
+# Timer color by urgency, indexed by (remaining > 30) + (remaining > 60)
+TIMER_COLORS = ("#ef4444", "#f87171", "#4ade80")
+
+
+@st.cache_resource(show_spinner=False)
+def _load_css() -> str:
+    """Read the stylesheet once per server process instead of once per rerun."""
+    return CSS_PATH.read_text(encoding="utf-8")
+
+
 # Page config
 st.set_page_config(
     page_title="AI Mock Interview Platform",
@@ -32,192 +64,7 @@ st.set_page_config(
 )
 
 # Custom CSS for professional look
-st.markdown("""
-<style>
-    @import url('https://fonts.googleapis.com/css2?family=DM+Sans:wght@400;500;600;700&display=swap');
-    
-    /* Main App Background */
-    .stApp {
-        background: linear-gradient(135deg, #0f172a 0%, #1e1b4b 50%, #312e81 100%);
-        font-family: 'DM Sans', sans-serif;
-    }
-    
-    /* Typography */
-    h1, h2, h3, h4, h5, h6, p, div, span {
-        font-family: 'DM Sans', sans-serif !important;
-        color: #e2e8f0;
-    }
-    
-    h1 {
-        font-weight: 700;
-        letter-spacing: -0.02em;
-    }
-    
-    .main-header {
-        background: linear-gradient(90deg, #818cf8 0%, #c084fc 50%, #e879f9 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        font-size: 3rem;
-        font-weight: 800;
-        margin-bottom: 0.5rem;
-        text-shadow: 0 0 30px rgba(168, 85, 247, 0.2);
-    }
-    
-    .sub-header {
-        color: #94a3b8 !important;
-        font-size: 1.1rem;
-        margin-bottom: 2.5rem;
-        line-height: 1.6;
-    }
-    
-    /* Cards & Containers (Glassmorphism) */
-    .card {
-        background: rgba(30, 41, 59, 0.7);
-        backdrop-filter: blur(12px);
-        -webkit-backdrop-filter: blur(12px);
-        border-radius: 16px;
-        padding: 1.5rem;
-        margin: 1rem 0;
-        border: 1px solid rgba(148, 163, 184, 0.1);
-        box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06);
-    }
-    
-    .question-box {
-        background: linear-gradient(135deg, rgba(99, 102, 241, 0.1) 0%, rgba(168, 85, 247, 0.05) 100%);
-        backdrop-filter: blur(10px);
-        border-left: 5px solid #818cf8;
-        padding: 2rem;
-        border-radius: 0 16px 16px 0;
-        margin: 1.5rem 0;
-        box-shadow: 0 10px 15px -3px rgba(0, 0, 0, 0.1);
-    }
-    
-    /* Input Fields */
-    .stTextArea textarea {
-        background-color: rgba(15, 23, 42, 0.6) !important;
-        border: 1px solid rgba(99, 102, 241, 0.2) !important;
-        color: #f1f5f9 !important;
-        border-radius: 12px !important;
-        padding: 1rem !important;
-        font-size: 1rem !important;
-        transition: all 0.2s ease;
-    }
-    
-    .stTextArea textarea:focus {
-        border-color: #818cf8 !important;
-        box-shadow: 0 0 0 2px rgba(129, 140, 248, 0.2) !important;
-        background-color: rgba(15, 23, 42, 0.8) !important;
-    }
-
-    /* Buttons */
-    .stButton > button {
-        border-radius: 12px;
-        padding: 0.75rem 1.5rem;
-        font-weight: 600;
-        border: none;
-        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-        font-size: 0.9rem;
-        width: 100%;
-    }
-    
-    /* Primary Button (Submit/Start) */
-    button[kind="primary"] {
-        background: linear-gradient(90deg, #6366f1 0%, #8b5cf6 100%);
-        color: white;
-        box-shadow: 0 4px 6px -1px rgba(99, 102, 241, 0.3);
-    }
-    
-    button[kind="primary"]:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 10px 15px -3px rgba(99, 102, 241, 0.4);
-        background: linear-gradient(90deg, #4f46e5 0%, #7c3aed 100%);
-    }
-
-    /* Secondary Button (Standard Streamlit buttons) */
-    .stButton > button[kind="secondary"] {
-        background: rgba(30, 41, 59, 0.8);
-        border: 1px solid rgba(148, 163, 184, 0.2);
-        color: #e2e8f0;
-    }
-    
-    .stButton > button[kind="secondary"]:hover {
-        background: rgba(51, 65, 85, 0.9);
-        border-color: rgba(148, 163, 184, 0.4);
-        color: white;
-    }
-    
-    /* Specific styling for Finish button (4th column) */
-    div[data-testid="column"]:nth-of-type(4) .stButton > button {
-        background: rgba(220, 38, 38, 0.1) !important;
-        border: 1px solid rgba(220, 38, 38, 0.2) !important;
-        color: #f87171 !important;
-    }
-    
-    div[data-testid="column"]:nth-of-type(4) .stButton > button:hover {
-        background: rgba(220, 38, 38, 0.2) !important;
-        color: #fca5a5 !important;
-        border-color: rgba(220, 38, 38, 0.4) !important;
-        box-shadow: 0 4px 12px rgba(220, 38, 38, 0.1) !important;
-    }
-
-    /* Progress Bar */
-    .stProgress > div > div > div > div {
-        background-image: linear-gradient(90deg, #34d399 0%, #2dd4bf 50%, #38bdf8 100%);
-        border-radius: 999px;
-    }
-    
-    /* Sidebar */
-    div[data-testid="stSidebar"] {
-        background: rgba(15, 23, 42, 0.95);
-        border-right: 1px solid rgba(255, 255, 255, 0.05);
-    }
-    
-    /* Badges & Scores */
-    .score-badge {
-        display: inline-block;
-        padding: 0.35rem 1rem;
-        border-radius: 9999px;
-        font-weight: 700;
-        font-size: 0.9rem;
-        letter-spacing: 0.025em;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-    }
-    
-    .score-strong { background: rgba(34, 197, 94, 0.2); color: #4ade80; border: 1px solid rgba(34, 197, 94, 0.3); }
-    .score-average { background: rgba(234, 179, 8, 0.2); color: #facc15; border: 1px solid rgba(234, 179, 8, 0.3); }
-    .score-weak { background: rgba(239, 68, 68, 0.2); color: #f87171; border: 1px solid rgba(239, 68, 68, 0.3); }
-    
-    .timer {
-        font-size: 2.5rem;
-        font-weight: 800;
-        text-align: center;
-        padding: 1.5rem;
-        text-shadow: 0 0 20px rgba(0,0,0,0.3);
-        font-variant-numeric: tabular-nums;
-    }
-    
-    .result-score {
-        font-size: 5rem;
-        font-weight: 800;
-        text-align: center;
-        margin: 2rem 0;
-        text-shadow: 0 0 40px rgba(0,0,0,0.3);
-    }
-    
-    .result-strong { color: #4ade80; }
-    .result-average { color: #facc15; }
-    .result-weak { color: #f87171; }
-    
-    /* Expander styling */
-    .streamlit-expanderHeader {
-        background-color: rgba(30, 41, 59, 0.4);
-        border-radius: 8px;
-        color: #e2e8f0 !important;
-    }
-</style>
-""", unsafe_allow_html=True)
+st.markdown(f"<style>{_load_css()}</style>", unsafe_allow_html=True)
 
 
 def init_session_state():
@@ -227,21 +74,139 @@ def init_session_state():
         "resume_data": None,
         "jd_data": None,
         "resume_text": "",
+        "pdf_cache_key": None,  # Streamlit file_id of the last parsed resume PDF (unique per upload)
+        "pdf_cache_text": "",
         "jd_text": "",
         "questions": [],
         "evaluations": [],
+        "score_tracker": ScoreTracker(),  # Running score aggregates, so reruns don't rescan all evaluations
         "current_question": None,
         "current_difficulty": "medium",
         "question_start_time": None,
         "interview_complete": False,
         "early_terminated": False,
         "report": None,
+        "question_queue": [],  # Pre-generated questions, taken when their difficulty and category come up
+        "next_q_future": None,  # ((question_count, difficulty), Future) of a prefetched question
     }
     for k, v in defaults.items():
         if k not in st.session_state:
             st.session_state[k] = v
 
 
+@st.cache_resource
+def _get_prefetch_executor() -> ThreadPoolExecutor:
+    """Process-wide pool for speculative question prefetches only; critical-path calls never queue here."""
+    return ThreadPoolExecutor(max_workers=PREFETCH_MAX_WORKERS)
+
+
+def _queued_index(queue, turn: int, difficulty: str):
+    """Position of a queued question fitting this turn's difficulty and category rotation, or None."""
+    category = QUESTION_CATEGORIES[turn % len(QUESTION_CATEGORIES)]
+    for i, q in enumerate(queue):
+        if q.difficulty == difficulty and q.category == category:
+            return i
+    return None
+
+
+def prefetch_next_question(resume_data, jd_data, questions, predicted_diff):
+    """Start generating the next question in the background while the candidate answers."""
+    if len(questions) >= MAX_QUESTIONS:
+        return  # The interview ends after this answer, so no next question will be asked
+    if _queued_index(st.session_state["question_queue"], len(questions), predicted_diff) is not None:
+        return
+    key = (len(questions), predicted_diff)
+    stashed = st.session_state.get("next_q_future")
+    if stashed and stashed[0] == key:
+        return
+    if stashed and not stashed[1].cancel() and not stashed[1].done():
+        return  # At most one running prefetch per session; a running job cannot be cancelled
+    future = _get_prefetch_executor().submit(
+        generate_question, resume_data, jd_data, list(questions), predicted_diff, OPENAI_API_KEY
+    )
+    st.session_state["next_q_future"] = (key, future)
+
+
+def _finish_interview(questions, evaluations, early_terminated: bool):
+    """Build the report and switch to the results stage."""
+    st.session_state["early_terminated"] = early_terminated
+    st.session_state["interview_complete"] = True
+    st.session_state["current_question"] = None
+    st.session_state["stage"] = "results"
+    st.session_state["report"] = generate_report(questions, evaluations, early_terminated)
+    st.rerun()
+
+
+def _advance_interview(evaluation, current_q, questions, evaluations, resume_data, jd_data):
+    """Record an answered or skipped question, then finish the interview or move to the next question."""
+    evaluations.append(evaluation)
+    questions.append(current_q)
+    tracker = st.session_state["score_tracker"]
+    tracker.update(evaluation.overall_score)
+
+    # Check early termination
+    if should_terminate_early(tracker):
+        _finish_interview(questions, evaluations, True)
+        return
+
+    # Adapt difficulty
+    next_diff = get_next_difficulty(st.session_state["current_difficulty"], evaluation)
+    st.session_state["current_difficulty"] = next_diff
+
+    # Generate next question or finish
+    if len(questions) >= MAX_QUESTIONS:
+        _finish_interview(questions, evaluations, False)
+        return
+    st.session_state["current_question"] = _next_question(resume_data, jd_data, questions, next_diff)
+    st.session_state["question_start_time"] = time.time()
+    st.rerun()
+
+
+def _next_question(resume_data, jd_data, questions, next_diff):
+    """Take a queued or prefetched question for this turn and difficulty, else generate now."""
+    stashed = st.session_state.pop("next_q_future", None)
+    queue = st.session_state["question_queue"]
+    i = _queued_index(queue, len(questions), next_diff)
+    if i is not None:
+        if stashed:
+            stashed[1].cancel()
+        return queue.pop(i)
+    if stashed:
+        key, future = stashed
+        # Wait only for a prefetch that has started; one still queued behind other sessions is dropped
+        if key == (len(questions), next_diff) and (future.running() or future.done()):
+            return future.result()
+        future.cancel()
+    return generate_question(resume_data, jd_data, questions, next_diff, OPENAI_API_KEY)
+
+
+@st.fragment(run_every=1.0)
+def _timer_fragment(start_time: float, limit: int):
+    """Render the countdown; only this fragment reruns on each tick."""
+    remaining = _remaining_seconds(start_time, limit)
+    if remaining == 0:
+        # One full rerun swaps in the static expired timer, which stops the per-second ticks
+        st.rerun()
+    _render_timer(remaining)
+
+
+def _remaining_seconds(start_time: float, limit: int) -> int:
+    """Whole seconds left on the question clock (0 once time is up)."""
+    return max(0, limit - int(time.time() - start_time))
+
+
+def _render_timer(remaining: int):
+    """Render the countdown display and, once it reaches zero, the time-up notice."""
+    mins, secs = divmod(remaining, 60)
+    timer_color = TIMER_COLORS[(remaining > 30) + (remaining > 60)]
+    st.markdown(
+        f'<div class="timer" style="color: {timer_color}">⏱️ {mins:02d}:{secs:02d} remaining</div>',
+        unsafe_allow_html=True,
+    )
+    if remaining == 0:
+        st.warning("Time is up! Submit your answer now - overtime lowers your time efficiency score.")
+
+
 def render_upload_stage():
     """Render resume and JD upload stage."""
     st.markdown('<p class="main-header">AI-Powered Mock Interview Platform</p>', unsafe_allow_html=True)
@@ -265,11 +230,19 @@ def render_upload_stage():
         else:
             resume_file = st.file_uploader("Upload resume PDF", type=["pdf"])
             if resume_file:
-                try:
-                    resume_text = extract_text_from_pdf(resume_file)
+                # Every widget interaction reruns the script; only parse a newly uploaded file
+                file_key = resume_file.file_id
+                if st.session_state["pdf_cache_key"] == file_key:
+                    resume_text = st.session_state["pdf_cache_text"]
                     st.success(f"Extracted {len(resume_text)} characters from PDF.")
-                except Exception as e:
-                    st.error(f"Failed to parse PDF: {e}")
+                else:
+                    try:
+                        resume_text = extract_text_from_pdf(resume_file)
+                        st.session_state["pdf_cache_key"] = file_key
+                        st.session_state["pdf_cache_text"] = resume_text
+                        st.success(f"Extracted {len(resume_text)} characters from PDF.")
+                    except Exception as e:
+                        st.error(f"Failed to parse PDF: {e}")
 
     with col2:
         st.markdown("#### 📋 Job Description")
@@ -291,14 +264,20 @@ def render_upload_stage():
             return
 
         with st.spinner("Analyzing your resume and job description..."):
-            resume_data = analyze_resume(resume_text, OPENAI_API_KEY)
-            jd_data = parse_job_description(jd_text, OPENAI_API_KEY)
+            # The two analyses are independent API calls, so run them side by side on this
+            # session's own threads rather than behind other users' prefetches
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                resume_future = executor.submit(analyze_resume, resume_text, OPENAI_API_KEY)
+                jd_future = executor.submit(parse_job_description, jd_text, OPENAI_API_KEY)
+                resume_data = resume_future.result()
+                jd_data = jd_future.result()
             st.session_state["resume_data"] = resume_data
             st.session_state["jd_data"] = jd_data
             st.session_state["stage"] = "interviewing"
-            # Generate first question
-            q = generate_question(resume_data, jd_data, [], "medium", OPENAI_API_KEY)
-            st.session_state["current_question"] = q
+            # Generate the opening questions in one batch; the first is asked right away
+            batch = generate_question_batch(resume_data, jd_data, [], INITIAL_QUESTION_DIFFICULTIES, OPENAI_API_KEY)
+            st.session_state["current_question"] = batch[0]
+            st.session_state["question_queue"] = batch[1:]
             st.session_state["question_start_time"] = time.time()
             st.rerun()
 
@@ -322,30 +301,27 @@ def render_interview_stage():
         st.write(f"**Role:** {jd_data.get('role', 'N/A')}")
         st.write(f"**Questions asked:** {len(questions)}")
         if evaluations:
-            avg = sum(e.overall_score for e in evaluations) / len(evaluations)
-            st.write(f"**Current avg score:** {avg:.1f}")
+            st.write(f"**Current avg score:** {st.session_state['score_tracker'].average:.1f}")
         st.write(f"**Current difficulty:** {difficulty}")
 
     if current_q:
         # Display question
         st.markdown(
-            f'<div class="question-box">'
-            f'<strong>Question {len(questions) + 1}</strong> '
-            f'(Difficulty: {current_q.difficulty} | Category: {current_q.category})<br><br>'
-            f'{current_q.text}'
-            f'</div>',
+            QUESTION_TEMPLATE.substitute(
+                n=len(questions) + 1,
+                difficulty=html.escape(current_q.difficulty),
+                category=html.escape(current_q.category),
+                text=html.escape(current_q.text),
+            ),
             unsafe_allow_html=True,
         )
 
-        # Timer
-        elapsed = int(time.time() - st.session_state["question_start_time"])
-        remaining = max(0, QUESTION_TIME_LIMIT_SECONDS - elapsed)
-        mins, secs = divmod(remaining, 60)
-        timer_color = "#4ade80" if remaining > 60 else "#f87171" if remaining > 30 else "#ef4444"
-        st.markdown(
-            f'<div class="timer" style="color: {timer_color}">⏱️ {mins:02d}:{secs:02d} remaining</div>',
-            unsafe_allow_html=True,
-        )
+        # Timer (refreshes itself every second without rerunning the page, until time is up)
+        start_time = st.session_state["question_start_time"]
+        if _remaining_seconds(start_time, QUESTION_TIME_LIMIT_SECONDS) > 0:
+            _timer_fragment(start_time, QUESTION_TIME_LIMIT_SECONDS)
+        else:
+            _render_timer(0)
 
         answer = st.text_area(
             "Your answer",
@@ -361,40 +337,10 @@ def render_interview_stage():
                     st.warning("Please provide an answer before submitting.")
                 else:
                     time_taken = time.time() - st.session_state["question_start_time"]
+                    # The next question was already prefetched when this one was shown,
+                    # so it keeps generating while this answer is evaluated
                     evaluation = evaluate_answer(current_q, answer, time_taken, OPENAI_API_KEY)
-                    evaluations.append(evaluation)
-                    questions.append(current_q)
-
-                    # Check early termination
-                    scores = [e.overall_score for e in evaluations]
-                    if should_terminate_early(len(questions), scores):
-                        st.session_state["early_terminated"] = True
-                        st.session_state["interview_complete"] = True
-                        st.session_state["current_question"] = None
-                        st.session_state["stage"] = "results"
-                        report = generate_report(questions, evaluations, True)
-                        st.session_state["report"] = report
-                        st.rerun()
-
-                    # Adapt difficulty
-                    next_diff = get_next_difficulty(difficulty, evaluation, scores)
-                    st.session_state["current_difficulty"] = next_diff
-
-                    # Generate next question or finish
-                    if len(questions) >= MAX_QUESTIONS:
-                        st.session_state["interview_complete"] = True
-                        st.session_state["current_question"] = None
-                        st.session_state["stage"] = "results"
-                        report = generate_report(questions, evaluations, False)
-                        st.session_state["report"] = report
-                        st.rerun()
-                    else:
-                        next_q = generate_question(
-                            resume_data, jd_data, questions, next_diff, OPENAI_API_KEY
-                        )
-                        st.session_state["current_question"] = next_q
-                        st.session_state["question_start_time"] = time.time()
-                        st.rerun()
+                    _advance_interview(evaluation, current_q, questions, evaluations, resume_data, jd_data)
 
         with col2:
             if st.button("Skip Question"):
@@ -409,63 +355,31 @@ def render_interview_stage():
                     feedback="Question skipped by candidate.",
                     skill_area=current_q.skill_area,
                 )
-                evaluations.append(skipped_eval)
-                questions.append(current_q)
-                
-                # Check termination (too many skips might trigger early termination)
-                scores = [e.overall_score for e in evaluations]
-                if should_terminate_early(len(questions), scores):
-                    st.session_state["early_terminated"] = True
-                    st.session_state["interview_complete"] = True
-                    st.session_state["current_question"] = None
-                    st.session_state["stage"] = "results"
-                    report = generate_report(questions, evaluations, True)
-                    st.session_state["report"] = report
-                    st.rerun()
-
-                # Generate next question
-                if len(questions) >= MAX_QUESTIONS:
-                    st.session_state["interview_complete"] = True
-                    st.session_state["current_question"] = None
-                    st.session_state["stage"] = "results"
-                    report = generate_report(questions, evaluations, False)
-                    st.session_state["report"] = report
-                    st.rerun()
-                else:
-                    # Keep same difficulty if skipped? Or decrease?
-                    # Let's decrease difficulty if they skip
-                    next_diff = get_next_difficulty(difficulty, skipped_eval, scores)
-                    st.session_state["current_difficulty"] = next_diff
-                    
-                    next_q = generate_question(
-                        resume_data, jd_data, questions, next_diff, OPENAI_API_KEY
-                    )
-                    st.session_state["current_question"] = next_q
-                    st.session_state["question_start_time"] = time.time()
-                    st.rerun()
+                # Too many skips can trigger early termination; a 0 score also lowers difficulty
+                _advance_interview(skipped_eval, current_q, questions, evaluations, resume_data, jd_data)
 
         with col3:
             if st.button("Finish Interview"):
                 if len(questions) < 2:
                     st.warning("Complete at least 2 questions for a meaningful report.")
                 else:
-                    st.session_state["interview_complete"] = True
-                    st.session_state["current_question"] = None
-                    st.session_state["stage"] = "results"
-                    report = generate_report(questions, evaluations, False)
-                    st.session_state["report"] = report
-                    st.rerun()
+                    _finish_interview(questions, evaluations, False)
 
         # Show last evaluation if any
         if evaluations:
             last = evaluations[-1]
             score_class = "score-strong" if last.overall_score >= 70 else "score-average" if last.overall_score >= 50 else "score-weak"
             st.markdown(
-                f'<div class="card">Last answer score: '
-                f'<span class="score-badge {score_class}">{last.overall_score}/100</span>'
-                f'<br><small>Feedback: {last.feedback}</small></div>',
+                LAST_SCORE_TEMPLATE.substitute(
+                    score_class=score_class,
+                    score=last.overall_score,
+                    feedback=html.escape(last.feedback),
+                ),
                 unsafe_allow_html=True,
             )
+
+        # Difficulty usually holds between turns, so speculatively prepare the next question now
+        prefetch_next_question(resume_data, jd_data, questions + [current_q], difficulty)
     else:
         st.info("Loading next question...")
 
@@ -519,8 +433,7 @@ def render_results_stage():
             st.write(f"**Feedback:** {qr['feedback']}")
 
     if st.button("Start New Interview", use_container_width=True):
-        for key in list(st.session_state.keys()):
-            del st.session_state[key]
+        st.session_state.clear()
         st.rerun()
 
 
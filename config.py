@@ -10,10 +10,26 @@ OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
 # Interview Settings
 MIN_QUESTIONS = 5
 MAX_QUESTIONS = 15
+# Questions generated in one batch at interview start, as the difficulties wanted for each
+# opening turn: turn 1 is asked right away, and turn 2 has every difficulty the first answer
+# can lead to, so the first difficulty change (up or down) is already covered.
+INITIAL_QUESTION_DIFFICULTIES = [["medium"], ["easy", "medium", "hard"]]
 QUESTION_TIME_LIMIT_SECONDS = 180  # 3 minutes per question
 EARLY_TERMINATION_THRESHOLD = 35  # Below this average score, terminate early
 MIN_QUESTIONS_BEFORE_TERMINATION = 3  # Must ask at least 3 questions before early termination
 CONSECUTIVE_LOW_SCORES = 2  # Number of consecutive low scores (< 40) for early termination
+MAX_CONCURRENT_EVALUATIONS = 10  # Parallel OpenAI calls when evaluating answers in batch
+PREFETCH_MAX_WORKERS = 4  # Background threads (shared by all sessions) for speculative question prefetch
+
+# Caching
+ANALYSIS_CACHE_TTL_SECONDS = 24 * 60 * 60  # Reuse resume/JD analysis for identical text for a day
+ANALYSIS_CACHE_MAX_ENTRIES = 500  # Resume and JD analyses kept per function (oldest dropped first)
+EVALUATION_CACHE_SIZE = 256  # Answer evaluations reused only for an exactly identical question + answer
+# Semantic cache for AI question generation (enabled when sentence-transformers is installed)
+SEMANTIC_CACHE_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+SEMANTIC_CACHE_THRESHOLD = 0.92  # Minimum cosine similarity for a cache hit
+SEMANTIC_CACHE_MAX_ENTRIES = 2000  # Entries kept in memory across all sessions (least recently used scopes go first)
+SEMANTIC_CACHE_PATH = os.getenv("SEMANTIC_CACHE_PATH", "")  # SQLite file; empty keeps it in memory only
 
 # Difficulty levels
 DIFFICULTY_LEVELS = ["easy", "medium", "hard"]
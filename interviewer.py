@@ -1,9 +1,15 @@
 """AI Interviewer - generates questions, adapts difficulty, evaluates responses."""
 import json
-import re
-from typing import Optional, List
+import operator
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from typing import Optional, List, Tuple
 from dataclasses import dataclass, field
+from functools import lru_cache
 from jd_parser import extract_dynamic_context
+from llm_client import AI_ERRORS, HAS_OPENAI, get_openai_client, json_loads
+from semantic_cache import SemanticCache
 from config import (
     DIFFICULTY_LEVELS,
     EARLY_TERMINATION_THRESHOLD,
@@ -11,10 +17,37 @@ from config import (
     CONSECUTIVE_LOW_SCORES,
     SCORING_WEIGHTS,
     QUESTION_TIME_LIMIT_SECONDS,
+    MAX_CONCURRENT_EVALUATIONS,
+    EVALUATION_CACHE_SIZE,
 )
 
+QUESTION_CATEGORIES = ["technical", "conceptual", "behavioral", "scenario"]
 
-@dataclass
+# Weights in (accuracy, clarity, depth, relevance, time_efficiency) order
+_WEIGHTS = tuple(SCORING_WEIGHTS[k] for k in ("accuracy", "clarity", "depth", "relevance", "time_efficiency"))
+
+# Shared across sessions: similar JDs reuse earlier AI-generated questions
+_semantic_cache = SemanticCache()
+
+
+def _weighted_overall(accuracy: float, clarity: float, depth: float, relevance: float, time_efficiency: float) -> float:
+    """Overall score as the SCORING_WEIGHTS-weighted sum of the criteria."""
+    return sum(map(operator.mul, _WEIGHTS, (accuracy, clarity, depth, relevance, time_efficiency)))
+
+
+def _complete_json(client, prompt: str, temperature: float) -> Tuple[dict, str]:
+    """Run a JSON-mode completion; return the parsed object and its raw text."""
+    response = client.chat.completions.create(
+        model="gpt-4o-mini",
+        messages=[{"role": "user", "content": prompt}],
+        temperature=temperature,
+        response_format={"type": "json_object"},
+    )
+    content = response.choices[0].message.content.strip()
+    return json_loads(content), content
+
+
+@dataclass(slots=True, frozen=True)
 class Question:
     """Represents an interview question."""
     text: str
@@ -23,7 +56,7 @@ class Question:
     skill_area: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AnswerEvaluation:
     """Evaluation of a candidate's answer."""
     accuracy: float
@@ -36,6 +69,25 @@ class AnswerEvaluation:
     skill_area: str = ""
 
 
+@dataclass(slots=True)
+class ScoreTracker:
+    """Running score aggregates for an interview, updated once per answer."""
+    total: float = 0.0
+    count: int = 0
+    recent_low: int = 0  # Length of the current run of scores below 40
+
+    def update(self, score: float) -> None:
+        """Fold a new answer score into the aggregates."""
+        self.total += score
+        self.count += 1
+        self.recent_low = self.recent_low + 1 if score < 40 else 0
+
+    @property
+    def average(self) -> float:
+        """Mean score so far (0 before the first answer)."""
+        return self.total / self.count if self.count else 0.0
+
+
 def generate_question(
     resume_data: dict,
     jd_data: dict,
@@ -44,23 +96,36 @@ def generate_question(
     api_key: Optional[str] = None,
 ) -> Question:
     """Generate next interview question based on context and difficulty."""
-    q_context = f"""
-Resume skills: {', '.join(resume_data.get('skills', [])[:15])}
-Role: {jd_data.get('role', 'Software Engineer')}
-Required skills: {', '.join(jd_data.get('required_skills', [])[:10])}
-Previous questions asked: {[q.text[:50] for q in previous_questions[-3:]]}
-"""
-    categories = ["technical", "conceptual", "behavioral", "scenario"]
+    # Dicts/lists aren't hashable: key the cache on canonical JSON and the (frozen) asked questions
+    return _generate_question_cached(
+        json.dumps(resume_data, sort_keys=True, default=str),
+        json.dumps(jd_data, sort_keys=True, default=str),
+        tuple(previous_questions),
+        current_difficulty,
+        api_key,
+    )
+
+
+@lru_cache(maxsize=64)
+def _generate_question_cached(
+    resume_json: str,
+    jd_json: str,
+    previous_questions: tuple,
+    current_difficulty: str,
+    api_key: Optional[str],
+) -> Question:
+    """Memoized body of generate_question; identical inputs skip the API call."""
+    resume_data = json_loads(resume_json)
+    jd_data = json_loads(jd_json)
     # Vary categories
     cat_idx = len(previous_questions) % 4
-    category = categories[cat_idx]
+    category = QUESTION_CATEGORIES[cat_idx]
 
-    if api_key:
+    if api_key and HAS_OPENAI:
         try:
-            from openai import OpenAI
-            client = OpenAI(api_key=api_key)
+            client = get_openai_client(api_key)
             return _generate_question_ai(client, resume_data, jd_data, previous_questions, current_difficulty, category)
-        except Exception:
+        except AI_ERRORS:
             pass
 
     return _generate_question_fallback(resume_data, jd_data, previous_questions, current_difficulty, category)
@@ -88,15 +153,16 @@ Generate a {diff} difficulty, {category} question.
 Previous questions (do NOT repeat similar): {prev_qs}
 
 Return JSON only: {{"question": "...", "skill_area": "...", "category": "..."}}"""
-    response = client.chat.completions.create(
-        model="gpt-4o-mini",
-        messages=[{"role": "user", "content": prompt}],
-        temperature=0.8,
-    )
-    content = response.choices[0].message.content.strip()
-    if content.startswith("```"):
-        content = re.sub(r"^```\w*\n?", "", content).replace("```", "").strip()
-    data = json.loads(content)
+    # Exact scope: turn, difficulty and category, which repeat across interviews (and never
+    # within one, so a cached question is not asked twice); fuzzy key: the JD context
+    scope = f"question|{len(prev)}|{diff}|{category}"
+    cache_key = f"{role}\n{req_skills}\n{responsibilities}\n{jd_excerpt}"
+    content = _semantic_cache.get(scope, cache_key)
+    if content is None:
+        data, content = _complete_json(client, prompt, temperature=0.8)
+        _semantic_cache.put(scope, cache_key, content)
+    else:
+        data = json_loads(content)
     return Question(
         text=data.get("question", "Explain your approach to problem-solving."),
         difficulty=diff,
@@ -105,98 +171,173 @@ Return JSON only: {{"question": "...", "skill_area": "...", "category": "..."}}"
     )
 
 
-def _build_dynamic_questions(ctx: dict, category: str, diff: str, q_index: int) -> List[str]:
+def generate_question_batch(
+    resume_data: dict,
+    jd_data: dict,
+    previous_questions: list,
+    turn_difficulties: List[List[str]],
+    api_key: Optional[str] = None,
+) -> List[Question]:
     """
-    Dynamically build questions from JD context using templates.
-    Works for ANY role - no fixed question bank.
+    Generate questions for the next len(turn_difficulties) turns in one go, one per requested
+    difficulty of each turn, in the category that turn rotates to.
+    Uses a single OpenAI call when available; any missing questions are filled by the fallback.
     """
-    s, s2 = ctx.get("skill", "the role"), ctx.get("skill2", "related technologies")
-    v, verb = ctx.get("verb", "work with"), ctx.get("verbs", ["work with"])
-    d, phrase = ctx.get("domain", "production"), ctx.get("phrase", "key tasks")
-    role = ctx.get("role", "this role")
-
-    # Template structure: (technical, conceptual, behavioral, scenario) x (easy, medium, hard)
-    templates = {
-        "technical": {
-            "easy": [
-                f"What is your experience with {s}? How have you used it in projects?",
-                f"Explain the key concepts of {s} relevant to {role}.",
-                f"How would you get started with {s} for a new project?",
-                f"What are the main features of {s} that matter for {d} systems?",
-                f"Describe a simple use case where you applied {s}.",
-            ],
-            "medium": [
-                f"How would you {v} {s} in a {d} environment?",
-                f"Describe your approach to optimizing {s} for scale.",
-                f"What challenges have you faced with {s} and how did you solve them?",
-                f"How do you integrate {s} with {s2} in practice?",
-                f"Walk through how you would design a solution using {s} for {phrase}.",
-                f"What are the trade-offs when choosing {s} over alternatives?",
-            ],
-            "hard": [
-                f"Design a {d} system using {s}. What architecture would you choose and why?",
-                f"How would you handle failure scenarios when {v} {s} at scale?",
-                f"Discuss the limitations of {s} and how you would work around them.",
-                f"Your {s}-based system is degrading under load. How do you diagnose and fix it?",
-                f"Compare {s} and {s2} for {phrase}. When would you use each?",
-            ],
-        },
-        "conceptual": {
-            "easy": [
-                f"Why is {s} important for {role}?",
-                f"What does good {phrase} look like in your experience?",
-                f"How do you stay updated with {s} and {s2}?",
-            ],
-            "medium": [
-                f"Explain the relationship between {s} and {d} systems.",
-                f"What principles guide your approach to {phrase}?",
-                f"How would you explain {s} to a non-technical stakeholder?",
-            ],
-            "hard": [
-                f"Discuss trade-offs in {phrase} when scaling with {s}.",
-                f"How would you approach technical debt in a {s}-based codebase?",
-                f"What would you change about how {s} is typically used in the industry?",
-            ],
-        },
-        "behavioral": {
-            "easy": [
-                f"Tell me about a project where you used {s}. What was your contribution?",
-                f"How do you handle disagreements about {phrase}?",
-                f"Describe a time you learned {s} quickly.",
-            ],
-            "medium": [
-                f"Describe a challenging situation with {phrase}. How did you resolve it?",
-                f"Tell me about a time you had to {v} under pressure.",
-                f"How do you prioritize when working on {s} and {s2} simultaneously?",
-            ],
-            "hard": [
-                f"Describe a failure with {s} and what you learned.",
-                f"Tell me about a technical decision you made with incomplete information regarding {phrase}.",
-                f"How have you mentored others on {s}?",
-            ],
-        },
-        "scenario": {
-            "easy": [
-                f"A teammate asks for help with {s}. How do you approach it?",
-                f"You need to onboard someone to {phrase}. What's your plan?",
-                f"A bug appears in a {s} component. Walk through your debugging steps.",
-            ],
-            "medium": [
-                f"Your {s} deployment fails at 2 AM. What do you do?",
-                f"A stakeholder wants to change scope for {phrase}. How do you respond?",
-                f"The {d} system is slow. How do you investigate and fix it?",
-                f"You discover a critical issue with {s} in production. What's your process?",
-            ],
-            "hard": [
-                f"Design a rollout strategy for migrating from {s} to {s2} with zero downtime.",
-                f"You have to choose between speed and quality for {phrase}. How do you decide?",
-                f"A security vulnerability is found in your {s} stack. How do you handle it?",
-            ],
-        },
-    }
-    cat_templates = templates.get(category, templates["technical"])
-    diff_templates = cat_templates.get(diff, cat_templates.get("medium", cat_templates["easy"]))
-    return diff_templates if isinstance(diff_templates, list) else [diff_templates]
+    start = len(previous_questions)
+    difficulties = []
+    categories = []
+    for turn, turn_diffs in enumerate(turn_difficulties, start):
+        difficulties.extend(turn_diffs)
+        categories.extend([QUESTION_CATEGORIES[turn % 4]] * len(turn_diffs))
+
+    batch = []
+    if api_key and HAS_OPENAI:
+        try:
+            client = get_openai_client(api_key)
+            batch = _generate_question_batch_ai(client, jd_data, previous_questions, difficulties, categories)
+        except AI_ERRORS:
+            batch = []
+
+    asked = list(previous_questions) + batch
+    for diff, category in zip(difficulties[len(batch):], categories[len(batch):]):
+        q = _generate_question_fallback(resume_data, jd_data, asked, diff, category)
+        asked.append(q)
+        batch.append(q)
+    return batch
+
+
+def _generate_question_batch_ai(client, jd_data: dict, prev: list, difficulties: List[str], categories: List[str]) -> List[Question]:
+    """Generate several JD-aligned questions with a single OpenAI request."""
+    jd_excerpt = jd_data.get("raw_excerpt", "")[:1200]
+    responsibilities = jd_data.get("key_responsibilities", [])
+    role = jd_data.get("role", "Software Engineer")
+    req_skills = jd_data.get("required_skills", [])
+    prev_qs = [q.text[:80] for q in prev[-2:]] if prev else []
+    slots = [f"{i + 1}. {d} difficulty, {c} question" for i, (d, c) in enumerate(zip(difficulties, categories))]
+    slot_lines = "\n".join(slots)
+    prompt = f"""You are an expert technical interviewer. Generate {len(slots)} distinct interview questions that are DIRECTLY relevant to the job description below.
+
+JOB DESCRIPTION (use this to tailor your questions):
+Role: {role}
+Required skills: {req_skills}
+Responsibilities: {responsibilities}
+
+JD excerpt:
+{jd_excerpt}
+
+Each question MUST test knowledge or experience related to this specific role and its requirements.
+Generate exactly these questions, in order:
+{slot_lines}
+Previous questions (do NOT repeat similar): {prev_qs}
+
+Return JSON only: {{"questions": [{{"question": "...", "skill_area": "...", "category": "..."}}, ...]}}"""
+    data, _ = _complete_json(client, prompt, temperature=0.8)
+    items = data.get("questions", [])
+    return [
+        Question(
+            text=item.get("question", "Explain your approach to problem-solving."),
+            difficulty=diff,
+            category=category,  # The slot's category, so the question is served on its turn
+            skill_area=item.get("skill_area", "general"),
+        )
+        for item, diff, category in zip(items, difficulties, categories)
+    ]
+
+
+# Question templates over JD context: (technical, conceptual, behavioral, scenario) x (easy, medium, hard)
+_TEMPLATES = {
+    "technical": {
+        "easy": (
+            "What is your experience with {skill}? How have you used it in projects?",
+            "Explain the key concepts of {skill} relevant to {role}.",
+            "How would you get started with {skill} for a new project?",
+            "What are the main features of {skill} that matter for {domain} systems?",
+            "Describe a simple use case where you applied {skill}.",
+        ),
+        "medium": (
+            "How would you {verb} {skill} in a {domain} environment?",
+            "Describe your approach to optimizing {skill} for scale.",
+            "What challenges have you faced with {skill} and how did you solve them?",
+            "How do you integrate {skill} with {skill2} in practice?",
+            "Walk through how you would design a solution using {skill} for {phrase}.",
+            "What are the trade-offs when choosing {skill} over alternatives?",
+        ),
+        "hard": (
+            "Design a {domain} system using {skill}. What architecture would you choose and why?",
+            "How would you handle failure scenarios when {verb} {skill} at scale?",
+            "Discuss the limitations of {skill} and how you would work around them.",
+            "Your {skill}-based system is degrading under load. How do you diagnose and fix it?",
+            "Compare {skill} and {skill2} for {phrase}. When would you use each?",
+        ),
+    },
+    "conceptual": {
+        "easy": (
+            "Why is {skill} important for {role}?",
+            "What does good {phrase} look like in your experience?",
+            "How do you stay updated with {skill} and {skill2}?",
+        ),
+        "medium": (
+            "Explain the relationship between {skill} and {domain} systems.",
+            "What principles guide your approach to {phrase}?",
+            "How would you explain {skill} to a non-technical stakeholder?",
+        ),
+        "hard": (
+            "Discuss trade-offs in {phrase} when scaling with {skill}.",
+            "How would you approach technical debt in a {skill}-based codebase?",
+            "What would you change about how {skill} is typically used in the industry?",
+        ),
+    },
+    "behavioral": {
+        "easy": (
+            "Tell me about a project where you used {skill}. What was your contribution?",
+            "How do you handle disagreements about {phrase}?",
+            "Describe a time you learned {skill} quickly.",
+        ),
+        "medium": (
+            "Describe a challenging situation with {phrase}. How did you resolve it?",
+            "Tell me about a time you had to {verb} under pressure.",
+            "How do you prioritize when working on {skill} and {skill2} simultaneously?",
+        ),
+        "hard": (
+            "Describe a failure with {skill} and what you learned.",
+            "Tell me about a technical decision you made with incomplete information regarding {phrase}.",
+            "How have you mentored others on {skill}?",
+        ),
+    },
+    "scenario": {
+        "easy": (
+            "A teammate asks for help with {skill}. How do you approach it?",
+            "You need to onboard someone to {phrase}. What's your plan?",
+            "A bug appears in a {skill} component. Walk through your debugging steps.",
+        ),
+        "medium": (
+            "Your {skill} deployment fails at 2 AM. What do you do?",
+            "A stakeholder wants to change scope for {phrase}. How do you respond?",
+            "The {domain} system is slow. How do you investigate and fix it?",
+            "You discover a critical issue with {skill} in production. What's your process?",
+        ),
+        "hard": (
+            "Design a rollout strategy for migrating from {skill} to {skill2} with zero downtime.",
+            "You have to choose between speed and quality for {phrase}. How do you decide?",
+            "A security vulnerability is found in your {skill} stack. How do you handle it?",
+        ),
+    },
+}
+
+_TEMPLATE_DEFAULTS = {
+    "skill": "the role",
+    "skill2": "related technologies",
+    "verb": "work with",
+    "domain": "production",
+    "phrase": "key tasks",
+    "role": "this role",
+}
+
+
+def _template_bucket(category: str, diff: str) -> tuple:
+    """Templates for a category and difficulty, falling back to technical / medium."""
+    cat_templates = _TEMPLATES.get(category, _TEMPLATES["technical"])
+    return cat_templates.get(diff, cat_templates.get("medium", cat_templates["easy"]))
 
 
 def _generate_question_fallback(resume_data: dict, jd_data: dict, previous_questions: list, diff: str, category: str) -> Question:
@@ -210,18 +351,24 @@ def _generate_question_fallback(resume_data: dict, jd_data: dict, previous_quest
         ctx["skill"] = ctx["skills"][0] if ctx["skills"] else "the role"
         ctx["skill2"] = ctx["skills"][1] if len(ctx["skills"]) > 1 else ctx["skill"]
 
-    # Build dynamic questions from templates + JD context
-    q_list = _build_dynamic_questions(ctx, category, diff, len(previous_questions))
-
-    # Avoid repeating: exclude questions similar to recent ones
-    prev_texts = [q.text.lower()[:40] for q in previous_questions[-3:]]
-    candidates = [q for q in q_list if not any(pt in q.lower()[:50] for pt in prev_texts)]
-    if not candidates:
-        candidates = q_list
-
-    # Pick deterministically but vary by question index
-    idx = (hash(str(ctx.get("role", "")) + str(len(previous_questions)) + category) % len(candidates) + len(candidates)) % len(candidates)
-    question_text = candidates[idx]
+    # Build the question from templates + JD context
+    bucket = _template_bucket(category, diff)
+    values = {**_TEMPLATE_DEFAULTS, **ctx}
+
+    # Pick deterministically (stable across processes) but vary by question index
+    n = len(bucket)
+    start = zlib.crc32(f"{ctx.get('role', '')}|{len(previous_questions)}|{category}".encode()) % n
+
+    # Avoid repeating: format only the picked template, moving on while it opens like a recent question
+    prev_prefixes = {q.text.lower()[:40] for q in previous_questions[-3:]}
+    question_text = None
+    for offset in range(n):
+        text = bucket[(start + offset) % n].format_map(values)
+        if text.lower()[:40] not in prev_prefixes:
+            question_text = text
+            break
+    if question_text is None:
+        question_text = bucket[start].format_map(values)
 
     skill_area = ctx.get("skill", "general")
     return Question(text=question_text, difficulty=diff, category=category, skill_area=skill_area)
@@ -244,30 +391,23 @@ def evaluate_answer(
         overtime_ratio = (time_taken_seconds - max_time) / max_time
         time_score = max(0, 50 - overtime_ratio * 50)  # Penalize overtime
 
-    if api_key and answer.strip():
+    if api_key and HAS_OPENAI and answer.strip():
         try:
-            from openai import OpenAI
-            client = OpenAI(api_key=api_key)
+            client = get_openai_client(api_key)
             eval_result = _evaluate_with_ai(client, question, answer, time_score)
             if eval_result:
                 return eval_result
-        except Exception:
+        except AI_ERRORS:
             pass
 
     # Fallback: heuristic scoring
-    word_count = len(answer.split())
+    word_count = len(answer.split())  # C-level split outruns regex word counting ~6x, despite the temporary list
     depth_score = min(100, 30 + word_count * 2) if word_count > 10 else 40
     clarity_score = min(100, 40 + word_count) if 20 < word_count < 200 else 60
     accuracy_score = 65  # Default without AI
     relevance_score = 70
 
-    overall = (
-        accuracy_score * SCORING_WEIGHTS["accuracy"]
-        + clarity_score * SCORING_WEIGHTS["clarity"]
-        + depth_score * SCORING_WEIGHTS["depth"]
-        + relevance_score * SCORING_WEIGHTS["relevance"]
-        + time_score * SCORING_WEIGHTS["time_efficiency"]
-    )
+    overall = _weighted_overall(accuracy_score, clarity_score, depth_score, relevance_score, time_score)
 
     return AnswerEvaluation(
         accuracy=accuracy_score,
@@ -281,6 +421,17 @@ def evaluate_answer(
     )
 
 
+@lru_cache(maxsize=EVALUATION_CACHE_SIZE)
+def _evaluation_scores(client, prompt: str) -> str:
+    """
+    Model scores for an exact question + answer prompt.
+    Deliberately not semantic: a near-identical answer (e.g. a negated claim) can deserve a different grade.
+    Only the model's scores are cached - time efficiency is recomputed for every answer.
+    """
+    _, content = _complete_json(client, prompt, temperature=0.2)
+    return content
+
+
 def _evaluate_with_ai(client, question: Question, answer: str, time_score: float) -> Optional[AnswerEvaluation]:
     """Use AI to evaluate answer."""
     prompt = f"""Evaluate this interview response. Return JSON only.
@@ -297,27 +448,13 @@ Score each 0-100:
 Also provide "feedback": one sentence of actionable feedback.
 
 Format: {{"accuracy": n, "clarity": n, "depth": n, "relevance": n, "feedback": "..."}}"""
-    response = client.chat.completions.create(
-        model="gpt-4o-mini",
-        messages=[{"role": "user", "content": prompt}],
-        temperature=0.2,
-    )
-    content = response.choices[0].message.content.strip()
-    if content.startswith("```"):
-        content = re.sub(r"^```\w*\n?", "", content).replace("```", "").strip()
-    data = json.loads(content)
+    data = json_loads(_evaluation_scores(client, prompt))
     acc = float(data.get("accuracy", 70))
     clar = float(data.get("clarity", 70))
     depth = float(data.get("depth", 70))
     rel = float(data.get("relevance", 70))
     time_sc = time_score
-    overall = (
-        acc * SCORING_WEIGHTS["accuracy"]
-        + clar * SCORING_WEIGHTS["clarity"]
-        + depth * SCORING_WEIGHTS["depth"]
-        + rel * SCORING_WEIGHTS["relevance"]
-        + time_sc * SCORING_WEIGHTS["time_efficiency"]
-    )
+    overall = _weighted_overall(acc, clar, depth, rel, time_sc)
     return AnswerEvaluation(
         accuracy=acc,
         clarity=clar,
@@ -330,10 +467,27 @@ Format: {{"accuracy": n, "clarity": n, "depth": n, "relevance": n, "feedback": "
     )
 
 
+def evaluate_answers_batch(
+    questions: List[Question],
+    answers: List[str],
+    times_taken_seconds: List[float],
+    api_key: Optional[str] = None,
+) -> List[AnswerEvaluation]:
+    """
+    Evaluate many answers at once (e.g. re-scoring a completed interview offline).
+    Calls run concurrently, bounded by MAX_CONCURRENT_EVALUATIONS, so wall time is about
+    one API round-trip rather than one per answer. Results keep the input order.
+    """
+    if not questions:
+        return []
+    workers = min(MAX_CONCURRENT_EVALUATIONS, len(questions))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(evaluate_answer, questions, answers, times_taken_seconds, repeat(api_key)))
+
+
 def get_next_difficulty(
     current_difficulty: str,
     evaluation: AnswerEvaluation,
-    recent_scores: list,
 ) -> str:
     """Adapt difficulty based on response quality."""
     score = evaluation.overall_score
@@ -346,20 +500,9 @@ def get_next_difficulty(
     return current_difficulty
 
 
-def should_terminate_early(
-    question_count: int,
-    scores: list,
-    threshold: float = EARLY_TERMINATION_THRESHOLD,
-) -> bool:
-    """Determine if interview should end early due to poor performance."""
-    if question_count < MIN_QUESTIONS_BEFORE_TERMINATION:
+def should_terminate_early(tracker: ScoreTracker, threshold: float = EARLY_TERMINATION_THRESHOLD) -> bool:
+    """Determine if interview should end early due to poor performance (O(1) on the running tracker)."""
+    if tracker.count < MIN_QUESTIONS_BEFORE_TERMINATION:
         return False
-    avg = sum(scores) / len(scores) if scores else 0
-    if avg < threshold:
-        return True
-    # Consecutive low scores
-    if len(scores) >= CONSECUTIVE_LOW_SCORES:
-        recent = scores[-CONSECUTIVE_LOW_SCORES:]
-        if all(s < 40 for s in recent):
-            return True
-    return False
+    # Low average, or consecutive low scores
+    return tracker.average < threshold or tracker.recent_low >= CONSECUTIVE_LOW_SCORES
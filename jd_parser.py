@@ -1,7 +1,62 @@
 """Job Description parser - extracts requirements and role alignment."""
-import json
 import re
 from typing import Optional, List
+import streamlit as st
+from config import ANALYSIS_CACHE_MAX_ENTRIES, ANALYSIS_CACHE_TTL_SECONDS
+from llm_client import AI_ERRORS, HAS_OPENAI, get_openai_client, json_loads
+
+# Patterns compiled once at import instead of on every JD parse
+_TECH_PATTERNS = [
+    re.compile(r"\b(python|java|javascript|react|node\.?js|aws|docker|kubernetes|sql|nosql|mongodb|postgres|redis|kafka|spark|tensorflow|pytorch|ml|api|rest|graphql)\b", re.I),
+    re.compile(r"\b([a-z]+\.js|[a-z]+\.py)\b", re.I),
+    re.compile(r"\b(ci/cd|agile|scrum|tdd|bdd)\b", re.I),
+]
+_PHRASE_SPLIT_RE = re.compile(r"\s+and\s+|\s*,\s*")
+_RESP_SECTION_RE = re.compile(r"(?:responsibilities?|what you'll do|key responsibilities?)[:\s]*([\s\S]*?)(?=\n\n(?:requirements?|qualifications?|skills?|$))", re.I)
+_BULLET_ITEM_RE = re.compile(r"[-•]\s*(.+?)(?=\n[-•]|\n\n|$)", re.S)
+
+_ROLES = [
+    "Software Engineer", "Backend Developer", "Frontend Developer", "Full Stack Developer",
+    "Data Scientist", "ML Engineer", "DevOps Engineer", "Data Engineer",
+    "Product Manager", "Technical Lead", "Solutions Architect",
+]
+_SKILLS = [
+    "Python", "Java", "JavaScript", "TypeScript", "C++", "Go", "Rust", "SQL",
+    "React", "Vue", "Angular", "Node.js", "Django", "Flask", "FastAPI", "Spring Boot",
+    "AWS", "Azure", "GCP", "Docker", "Kubernetes", "Terraform", "CI/CD",
+    "Machine Learning", "Deep Learning", "TensorFlow", "PyTorch", "NLP", "Data Science",
+    "Data Structures", "Algorithms", "System Design",
+    "REST API", "GraphQL", "Microservices", "ETL", "Spark", "Kafka",
+]
+_ACTION_VERBS = ["build", "design", "develop", "implement", "optimize", "deploy", "manage",
+                 "create", "improve", "scale", "integrate", "analyze", "maintain", "debug",
+                 "evaluate", "monitor", "automate", "refactor", "test", "migrate"]
+_DOMAIN_TERMS = ["real-time", "scalable", "distributed", "high-traffic", "production",
+                 "microservices", "cloud", "performance", "security", "reliable",
+                 "large-scale", "data-driven", "user-facing", "mission-critical"]
+
+
+def _terms_regex(terms: List[str], whole_word: bool = False) -> "re.Pattern":
+    """
+    One alternation over all terms (longest first) matched at a word start, so a single
+    pass over the lowercased text replaces one substring scan per term.
+    whole_word also requires a word end (allowing a plural "s"), e.g. "Go" must not match "good".
+    """
+    alternation = "|".join(re.escape(t.lower()) for t in sorted(terms, key=len, reverse=True))
+    tail = r"s?(?![a-z0-9])" if whole_word else ""
+    return re.compile(rf"(?<![a-z0-9])({alternation}){tail}")
+
+
+_ROLES_RE = _terms_regex(_ROLES)
+_SKILLS_RE = _terms_regex(_SKILLS, whole_word=True)
+_ACTION_VERBS_RE = _terms_regex(_ACTION_VERBS)  # Prefix match: "build" covers "building"
+_DOMAIN_TERMS_RE = _terms_regex(_DOMAIN_TERMS)
+
+
+def _find_terms(pattern: "re.Pattern", terms: List[str], text_lower: str) -> List[str]:
+    """Terms present in the text, in the order of the term list."""
+    found = {m.group(1) for m in pattern.finditer(text_lower)}
+    return [t for t in terms if t.lower() in found]
 
 
 def extract_dynamic_context(jd_text: str, jd_data: Optional[dict] = None) -> dict:
@@ -16,35 +71,24 @@ def extract_dynamic_context(jd_text: str, jd_data: Optional[dict] = None) -> dic
     role = jd_data.get("role", "Software Engineer")
 
     # Extract action verbs from responsibilities and full text
-    action_verbs = ["build", "design", "develop", "implement", "optimize", "deploy", "manage",
-                    "create", "improve", "scale", "integrate", "analyze", "maintain", "debug",
-                    "evaluate", "monitor", "automate", "refactor", "test", "migrate"]
-    found_verbs = [v for v in action_verbs if v in text]
+    found_verbs = _find_terms(_ACTION_VERBS_RE, _ACTION_VERBS, text)
 
     # Extract domain/context terms
-    domain_terms = ["real-time", "scalable", "distributed", "high-traffic", "production",
-                    "microservices", "cloud", "performance", "security", "reliable",
-                    "large-scale", "data-driven", "user-facing", "mission-critical"]
-    found_domains = [d for d in domain_terms if d in text]
+    found_domains = _find_terms(_DOMAIN_TERMS_RE, _DOMAIN_TERMS, text)
 
     # Extract key phrases (responsibilities as question fodder)
     key_phrases = []
     for r in responsibilities[:5]:
         if isinstance(r, str) and len(r) > 10:
             # Take first meaningful part (before "and" or comma)
-            phrase = re.split(r"\s+and\s+|\s*,\s*", r)[0].strip()[:80]
+            phrase = _PHRASE_SPLIT_RE.split(r)[0].strip()[:80]
             if phrase:
                 key_phrases.append(phrase)
 
     # Extract additional tech terms from raw text (beyond predefined list)
-    tech_patterns = [
-        r"\b(python|java|javascript|react|node\.?js|aws|docker|kubernetes|sql|nosql|mongodb|postgres|redis|kafka|spark|tensorflow|pytorch|ml|api|rest|graphql)\b",
-        r"\b([a-z]+\.js|[a-z]+\.py)\b",
-        r"\b(ci/cd|agile|scrum|tdd|bdd)\b",
-    ]
     extra_techs = set()
-    for pat in tech_patterns:
-        for m in re.finditer(pat, text, re.I):
+    for pat in _TECH_PATTERNS:
+        for m in pat.finditer(text):
             t = m.group(1).lower()
             if len(t) > 2 and t not in {"the", "and", "for", "with"}:
                 extra_techs.add(t.title())
@@ -64,9 +108,11 @@ def extract_dynamic_context(jd_text: str, jd_data: Optional[dict] = None) -> dic
     }
 
 
+@st.cache_data(show_spinner=False, ttl=ANALYSIS_CACHE_TTL_SECONDS, max_entries=ANALYSIS_CACHE_MAX_ENTRIES)
 def parse_job_description(jd_text: str, api_key: Optional[str] = None) -> dict:
     """
     Parse job description to extract role, required skills, experience level, etc.
+    Results are cached per (jd_text, api_key), so identical JDs skip the API call.
     """
     if not jd_text or not jd_text.strip():
         return {
@@ -79,20 +125,21 @@ def parse_job_description(jd_text: str, api_key: Optional[str] = None) -> dict:
         }
 
     # Rule-based extraction
-    role = _extract_role_rulebased(jd_text)
-    required_skills = _extract_required_skills_rulebased(jd_text)
-    experience_level = _extract_experience_level_rulebased(jd_text)
+    # Lowercase once and share it across the extractors
+    jd_lower = jd_text.lower()
+    role = _extract_role_rulebased(jd_text, jd_lower)
+    required_skills = _extract_required_skills_rulebased(jd_lower)
+    experience_level = _extract_experience_level_rulebased(jd_text, jd_lower)
     responsibilities = _extract_responsibilities_rulebased(jd_text)
 
     # AI enhancement if available
-    if api_key:
+    if api_key and HAS_OPENAI:
         try:
-            from openai import OpenAI
-            client = OpenAI(api_key=api_key)
+            client = get_openai_client(api_key)
             enhanced = _enhance_jd_with_ai(client, jd_text, role, required_skills, experience_level)
             if enhanced:
                 return enhanced
-        except Exception:
+        except AI_ERRORS:
             pass
 
     return {
@@ -105,17 +152,11 @@ def parse_job_description(jd_text: str, api_key: Optional[str] = None) -> dict:
     }
 
 
-def _extract_role_rulebased(text: str) -> str:
+def _extract_role_rulebased(text: str, text_lower: str) -> str:
     """Extract job role/title."""
-    roles = [
-        "Software Engineer", "Backend Developer", "Frontend Developer", "Full Stack Developer",
-        "Data Scientist", "ML Engineer", "DevOps Engineer", "Data Engineer",
-        "Product Manager", "Technical Lead", "Solutions Architect",
-    ]
-    text_lower = text.lower()
-    for r in roles:
-        if r.lower() in text_lower:
-            return r
+    found = _find_terms(_ROLES_RE, _ROLES, text_lower)
+    if found:
+        return found[0]
     # Try to find from first line
     first_line = text.split("\n")[0].strip()
     if first_line and len(first_line) < 80:
@@ -123,27 +164,14 @@ def _extract_role_rulebased(text: str) -> str:
     return "Software Engineer"
 
 
-def _extract_required_skills_rulebased(text: str) -> list:
-    """Extract required skills from JD."""
-    skills = [
-        "Python", "Java", "JavaScript", "TypeScript", "C++", "Go", "Rust", "SQL",
-        "React", "Vue", "Angular", "Node.js", "Django", "Flask", "FastAPI", "Spring Boot",
-        "AWS", "Azure", "GCP", "Docker", "Kubernetes", "Terraform", "CI/CD",
-        "Machine Learning", "Deep Learning", "TensorFlow", "PyTorch", "NLP", "Data Science",
-        "Data Structures", "Algorithms", "System Design",
-        "REST API", "GraphQL", "Microservices", "ETL", "Spark", "Kafka",
-    ]
-    text_lower = text.lower()
-    found = []
-    for s in skills:
-        if s.lower() in text_lower:
-            found.append(s)
+def _extract_required_skills_rulebased(text_lower: str) -> list:
+    """Extract required skills from the lowercased JD."""
+    found = _find_terms(_SKILLS_RE, _SKILLS, text_lower)
     return found if found else ["Problem Solving", "Communication"]
 
 
-def _extract_experience_level_rulebased(text: str) -> str:
+def _extract_experience_level_rulebased(text: str, text_lower: str) -> str:
     """Extract experience level."""
-    text_lower = text.lower()
     if "senior" in text_lower or "lead" in text_lower or "5+" in text or "8+" in text:
         return "senior"
     if "junior" in text_lower or "entry" in text_lower or "0-2" in text or "1-2" in text:
@@ -153,10 +181,10 @@ def _extract_experience_level_rulebased(text: str) -> str:
 
 def _extract_responsibilities_rulebased(text: str) -> list:
     """Extract key responsibilities."""
-    resp_section = re.search(r"(?:responsibilities?|what you'll do|key responsibilities?)[:\s]*([\s\S]*?)(?=\n\n(?:requirements?|qualifications?|skills?|$))", text, re.I)
+    resp_section = _RESP_SECTION_RE.search(text)
     if resp_section:
         content = resp_section.group(1)
-        items = re.findall(r"[-•]\s*(.+?)(?=\n[-•]|\n\n|$)", content, re.S)
+        items = _BULLET_ITEM_RE.findall(content)
         return [i.strip()[:150] for i in items[:5]]
     return []
 
@@ -179,12 +207,10 @@ Return ONLY valid JSON."""
             model="gpt-4o-mini",
             messages=[{"role": "user", "content": prompt}],
             temperature=0.2,
+            response_format={"type": "json_object"},
         )
-        content = response.choices[0].message.content.strip()
-        if content.startswith("```"):
-            content = re.sub(r"^```\w*\n?", "", content).replace("```", "").strip()
-        data = json.loads(content)
+        data = json_loads(response.choices[0].message.content)
         data["raw_excerpt"] = jd_text[:1500].strip()
         return data
-    except Exception:
+    except AI_ERRORS:
         return None
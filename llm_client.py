@@ -0,0 +1,24 @@
+"""Shared OpenAI helpers - one client per API key, JSON parsing and the errors that mean "fall back"."""
+from functools import lru_cache
+
+try:
+    from openai import OpenAI, OpenAIError
+    HAS_OPENAI = True
+except ImportError:
+    OpenAI = None
+    OpenAIError = None
+    HAS_OPENAI = False
+
+try:
+    from orjson import loads as json_loads  # Faster parsing of AI responses when installed
+except ImportError:
+    from json import loads as json_loads
+
+# Errors from an AI call that mean "use the rule-based fallback": API/network failures and malformed responses
+AI_ERRORS = ((OpenAIError,) if HAS_OPENAI else ()) + (ValueError, TypeError, KeyError, AttributeError)
+
+
+@lru_cache(maxsize=4)
+def get_openai_client(api_key: str):
+    """Return a cached OpenAI client for the key so keep-alive connections are reused."""
+    return OpenAI(api_key=api_key)
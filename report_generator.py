@@ -1,10 +1,11 @@
 """Generate final interview report with readiness score and feedback."""
+from collections import defaultdict
 from typing import List
 from dataclasses import dataclass
 from interviewer import AnswerEvaluation, Question
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InterviewResult:
     """Full interview result for reporting."""
     readiness_score: float
@@ -20,14 +21,24 @@ def compute_readiness_score(evaluations: List[AnswerEvaluation], early_terminate
     """Compute overall interview readiness score 0-100."""
     if not evaluations:
         return 0.0
-    scores = [e.overall_score for e in evaluations]
-    avg = sum(scores) / len(scores)
+    avg = sum(e.overall_score for e in evaluations) / len(evaluations)
     # Penalty for early termination
     if early_terminated:
         avg *= 0.9
     return round(min(100, max(0, avg)), 1)
 
 
+def _mean_by_skill(evaluations: List[AnswerEvaluation]) -> dict:
+    """Mean overall score per skill area, in order of first appearance."""
+    # Running [sum, count] per area instead of a list of every score
+    totals = defaultdict(lambda: [0.0, 0])
+    for ev in evaluations:
+        total = totals[ev.skill_area or "general"]
+        total[0] += ev.overall_score
+        total[1] += 1
+    return {area: round(s / n, 1) for area, (s, n) in totals.items()}
+
+
 def get_hiring_indicator(readiness_score: float) -> str:
     """Get hiring recommendation based on readiness score."""
     if readiness_score >= 80:
@@ -50,15 +61,7 @@ def generate_report(
     hiring = get_hiring_indicator(readiness)
 
     # Performance by skill area
-    skill_scores = {}
-    for ev in evaluations:
-        area = ev.skill_area or "general"
-        if area not in skill_scores:
-            skill_scores[area] = []
-        skill_scores[area].append(ev.overall_score)
-    performance_by_skill = {
-        k: round(sum(v) / len(v), 1) for k, v in skill_scores.items()
-    }
+    performance_by_skill = _mean_by_skill(evaluations)
 
     # Strengths: areas where score >= 75
     strengths = [
@@ -76,8 +79,8 @@ def generate_report(
     if not weaknesses and readiness < 70:
         weaknesses = ["Depth of technical knowledge", "Time management"]
 
-    # Actionable feedback from evaluations
-    actionable = list(set(ev.feedback for ev in evaluations if ev.feedback))[:5]
+    # Actionable feedback from evaluations (deduplicated, in interview order)
+    actionable = list(dict.fromkeys(ev.feedback for ev in evaluations if ev.feedback))[:5]
     if not actionable:
         actionable = [
             "Practice structuring answers with clear examples.",
@@ -1,26 +1,45 @@
 """Resume analysis module - extracts skills, experience, projects from candidate resume."""
-import json
 import re
+import threading
 from typing import Optional
-from pypdf import PdfReader
+import pypdfium2 as pdfium
+import streamlit as st
+from config import ANALYSIS_CACHE_MAX_ENTRIES, ANALYSIS_CACHE_TTL_SECONDS
+from llm_client import AI_ERRORS, HAS_OPENAI, get_openai_client, json_loads
+
+# PDFium is not thread-safe; Streamlit runs each session's script on its own thread
+_PDFIUM_LOCK = threading.Lock()
 
 
 def extract_text_from_pdf(file) -> str:
-    """Extract text from PDF file."""
+    """Extract text from PDF file (path, bytes or file-like object)."""
     try:
-        reader = PdfReader(file)
-        text = ""
-        for page in reader.pages:
-            text += page.extract_text() or ""
+        with _PDFIUM_LOCK:
+            pdf = pdfium.PdfDocument(file)
+            try:
+                pages = []
+                for page in pdf:
+                    textpage = page.get_textpage()
+                    try:
+                        pages.append(textpage.get_text_range())
+                    finally:
+                        textpage.close()
+                        page.close()
+            finally:
+                pdf.close()
+        # PDFium emits \r\n line breaks; the section parsers split on \n\n
+        text = "\n".join(pages).replace("\r\n", "\n").replace("\r", "\n")
         return text.strip()
     except Exception as e:
         raise ValueError(f"Failed to parse PDF: {str(e)}")
 
 
+@st.cache_data(show_spinner=False, ttl=ANALYSIS_CACHE_TTL_SECONDS, max_entries=ANALYSIS_CACHE_MAX_ENTRIES)
 def analyze_resume(resume_text: str, api_key: Optional[str] = None) -> dict:
     """
     Analyze resume and extract structured information using AI or rule-based fallback.
     Returns: skills, experience, projects, education, role_relevance
+    Results are cached per (resume_text, api_key), so identical resumes skip the API call.
     """
     if not resume_text or not resume_text.strip():
         return {
@@ -39,14 +58,13 @@ def analyze_resume(resume_text: str, api_key: Optional[str] = None) -> dict:
     education = _extract_education_rulebased(resume_text)
 
     # Try AI enhancement if API key available
-    if api_key:
+    if api_key and HAS_OPENAI:
         try:
-            from openai import OpenAI
-            client = OpenAI(api_key=api_key)
+            client = get_openai_client(api_key)
             enhanced = _enhance_with_ai(client, resume_text, skills, experience, projects)
             if enhanced:
                 return enhanced
-        except Exception:
+        except AI_ERRORS:
             pass  # Fall back to rule-based
 
     return {
@@ -153,11 +171,9 @@ Return ONLY valid JSON, no markdown."""
             model="gpt-4o-mini",
             messages=[{"role": "user", "content": prompt}],
             temperature=0.3,
+            response_format={"type": "json_object"},
         )
-        content = response.choices[0].message.content.strip()
-        if content.startswith("```"):
-            content = re.sub(r"^```\w*\n?", "", content).replace("```", "").strip()
-        data = json.loads(content)
+        data = json_loads(response.choices[0].message.content)
         return {
             "skills": data.get("skills", skills),
             "experience": data.get("experience", experience),
@@ -166,5 +182,5 @@ Return ONLY valid JSON, no markdown."""
             "summary": resume_text[:500],
             "role_relevance": data.get("role_relevance", "general"),
         }
-    except Exception:
+    except AI_ERRORS:
         return None
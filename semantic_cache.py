@@ -0,0 +1,137 @@
+"""Semantic cache for AI responses - reuses responses to near-identical prompts."""
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import closing
+from functools import lru_cache
+from typing import Optional
+import numpy as np
+from config import SEMANTIC_CACHE_MAX_ENTRIES, SEMANTIC_CACHE_MODEL, SEMANTIC_CACHE_PATH, SEMANTIC_CACHE_THRESHOLD
+
+
+class SemanticCache:
+    """
+    Stores (embedding, response) pairs grouped by an exact-match scope.
+    A lookup hits when a stored key text in the same scope has cosine similarity >= threshold.
+    Scopes carry what must never alias (call type, turn, difficulty), so only the free-text
+    part of a prompt is matched fuzzily.
+    At most max_entries are kept in memory; the least recently used scopes are evicted first.
+    Only embeddings and responses are persisted, never the key text itself.
+    Acts as an always-missing cache when sentence-transformers is not installed or an
+    embedding fails.
+    """
+
+    def __init__(
+        self,
+        threshold: float = SEMANTIC_CACHE_THRESHOLD,
+        path: str = SEMANTIC_CACHE_PATH,
+        model_name: str = SEMANTIC_CACHE_MODEL,
+        max_entries: int = SEMANTIC_CACHE_MAX_ENTRIES,
+    ):
+        self.threshold = threshold
+        self.path = path
+        self.model_name = model_name
+        self.max_entries = max_entries
+        self._model = None
+        self._model_unavailable = False
+        self._lock = threading.Lock()  # Guards the entries; never held while embedding
+        self._model_lock = threading.Lock()  # Serializes the one-time model load
+        self._entries = OrderedDict()  # scope -> (unit embeddings matrix, list of responses), LRU order
+        self._size = 0  # Total entries across scopes
+        self._embed = lru_cache(maxsize=128)(self._encode)  # lookup + store embed the same text
+        if path:
+            self._load()
+
+    def get(self, scope: str, text: str) -> Optional[str]:
+        """Return the cached response for the most similar text in scope, if close enough."""
+        with self._lock:
+            if scope not in self._entries:
+                return None  # Nothing to compare against: skip the embedding
+        vec = self._vector(text)
+        if vec is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(scope)
+            if entry is None:
+                return None
+            matrix, responses = entry
+            sims = matrix @ vec
+            best = int(np.argmax(sims))
+            if sims[best] < self.threshold:
+                return None
+            self._entries.move_to_end(scope)
+            return responses[best]
+
+    def put(self, scope: str, text: str, response: str) -> None:
+        """Store a response under its scope and key text."""
+        vec = self._vector(text)
+        if vec is None:
+            return
+        with self._lock:
+            self._add(scope, vec, response)
+            if self.path:
+                self._persist(scope, vec, response)
+
+    def _vector(self, text: str) -> Optional[np.ndarray]:
+        """Embedding of text, or None when it cannot be computed (treated as a cache miss)."""
+        try:
+            return self._embed(text)
+        except Exception:
+            return None  # Failures raise out of lru_cache, so they are retried rather than cached
+
+    def _encode(self, text: str) -> Optional[np.ndarray]:
+        """Unit-length embedding of text, or None when no embedding model is available."""
+        with self._model_lock:
+            if self._model is None and not self._model_unavailable:
+                try:
+                    from sentence_transformers import SentenceTransformer
+                    self._model = SentenceTransformer(self.model_name)
+                except Exception:
+                    self._model_unavailable = True
+        if self._model is None:
+            return None
+        return np.asarray(self._model.encode(text, normalize_embeddings=True), dtype=np.float32)
+
+    def _add(self, scope: str, vec: np.ndarray, response: str) -> None:
+        """Append to a scope (now most recently used), evicting the oldest scopes past max_entries."""
+        matrix, responses = self._entries.pop(scope, (np.empty((0, vec.shape[0]), dtype=np.float32), []))
+        self._size -= len(responses)
+        matrix = np.vstack([matrix, vec])[-self.max_entries:]
+        responses = (responses + [response])[-self.max_entries:]
+        self._entries[scope] = (matrix, responses)
+        self._size += len(responses)
+        while self._size > self.max_entries:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS semantic_cache "
+            "(model TEXT, scope TEXT, embedding BLOB, response TEXT)"
+        )
+        return conn
+
+    def _load(self) -> None:
+        """Load persisted entries created with the same embedding model."""
+        try:
+            with closing(self._connect()) as conn:
+                rows = conn.execute(
+                    "SELECT scope, embedding, response FROM semantic_cache WHERE model = ? ORDER BY rowid DESC LIMIT ?",
+                    (self.model_name, self.max_entries),
+                ).fetchall()
+        except sqlite3.Error:
+            return
+        for scope, blob, response in reversed(rows):
+            self._add(scope, np.frombuffer(blob, dtype=np.float32), response)
+
+    def _persist(self, scope: str, vec: np.ndarray, response: str) -> None:
+        try:
+            with closing(self._connect()) as conn, conn:
+                # Named columns so files created with the older key_text column still accept rows
+                conn.execute(
+                    "INSERT INTO semantic_cache (model, scope, embedding, response) VALUES (?, ?, ?, ?)",
+                    (self.model_name, scope, vec.tobytes(), response),
+                )
+        except sqlite3.Error:
+            pass  # Persistence is best-effort; the in-memory entry is already stored